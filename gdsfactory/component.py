@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 import kfactory as kf
 import numpy as np
 from kfactory import Instance, kdb
-from kfactory.kcell import cell, save_layout_options
+from kfactory.kcell import LockedError, cell, save_layout_options
 
 from gdsfactory.config import GDSDIR_TEMP
 from gdsfactory.port import pprint_ports, select_ports, to_dict
@@ -193,6 +193,53 @@ class Component(kf.KCell):
                 dcplx_trans=trans,
             )
 
+    def add_ports_from_arrays(
+        self,
+        names: list[str],
+        centers: np.ndarray,
+        width: float | np.ndarray,
+        orientation: float | np.ndarray,
+        layer: LayerSpec,
+        port_type: str = "optical",
+    ) -> list[kf.Port]:
+        """Adds a batch of ports on one layer from parallel arrays.
+
+        Resolves the layer once and snaps all the widths in one numpy call.
+
+        Args:
+            names: name of each port.
+            centers: (N, 2) array with the center of each port.
+            width: width of the ports, a scalar or one per port.
+            orientation: orientation of the ports, a scalar or one per port.
+            layer: layer spec to add the ports on.
+            port_type: port type (optical, electrical, ...)
+        """
+        from gdsfactory.pdk import get_layer
+
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        n = len(centers)
+        if len(names) != n:
+            raise ValueError(f"Got {len(names)} names for {n} port centers")
+
+        layer = get_layer(layer)
+        dbu = self.kcl.dbu
+        widths = np.broadcast_to(np.asarray(width, dtype=float), (n,))
+        dwidths = (np.round(widths / dbu) * dbu).tolist()
+        orientations = np.broadcast_to(np.asarray(orientation, dtype=float), (n,))
+
+        return [
+            self.create_port(
+                name=name,
+                dwidth=dwidth,
+                layer=layer,
+                port_type=port_type,
+                dcplx_trans=kdb.DCplxTrans(1, angle, False, x, y),
+            )
+            for name, (x, y), dwidth, angle in zip(
+                names, centers.tolist(), dwidths, orientations.tolist()
+            )
+        ]
+
     def from_kcell(self) -> Component:
         """Returns a Component from a KCell."""
         kdb_copy = self._kdb_copy()
@@ -239,25 +286,26 @@ class Component(kf.KCell):
         from gdsfactory.pdk import get_layer
 
         layer = get_layer(layer)
-        if len(points) == 2:
-            points = tuple(zip(points[0], points[1]))
+        if isinstance(
+            points, kdb.Polygon | kdb.DPolygon | kdb.DSimplePolygon | kdb.Region
+        ):
+            polygon = points
 
-        if isinstance(points, tuple | list | np.ndarray):
+        else:
+            if len(points) == 2:
+                points = tuple(zip(points[0], points[1]))
             points = ensure_tuple_of_tuples(points)
             polygon = kf.kdb.DPolygon()
             polygon.assign_hull(points)
 
-        elif isinstance(
-            points, kdb.Polygon | kdb.DPolygon | kdb.DSimplePolygon | kdb.Region
-        ):
-            polygon = points
-
         self.shapes(layer).insert(polygon)
 
-        if not isinstance(polygon, kdb.Region):
-            return Region(polygon.to_itype(self.kcl.dbu))
-        else:
+        if isinstance(polygon, kdb.Region):
             return polygon
+        elif isinstance(polygon, kdb.Polygon):
+            return Region(polygon)
+        else:
+            return Region(polygon.to_itype(self.kcl.dbu))
 
     def add_label(
         self,
@@ -384,6 +432,47 @@ class Component(kf.KCell):
         reference.flatten()
         return self
 
+    def add_shapes_from(self, component: Component) -> Component:
+        """Copies the shapes of a flat Component into this Component.
+
+        Cheaper than adding a reference and flattening it afterwards.
+        Instances and ports of the source Component are not copied.
+
+        Args:
+            component: Component without instances.
+
+        """
+        if component._kdb_cell.child_instances():
+            raise ValueError(
+                f"Component {component.name!r} has instances, use add_ref instead."
+            )
+        self._kdb_cell.copy_shapes(component._kdb_cell)
+        return self
+
+    def flatten(self, merge: bool = True) -> None:
+        """Flattens the Component.
+
+        Components without instances skip the klayout flatten, which gets slower
+        as the number of cells in the layout grows.
+
+        Args:
+            merge: Merge the shapes on all layers.
+        """
+        if self._kdb_cell.child_instances():
+            super().flatten(merge=merge)
+            return
+        if self._locked:
+            raise LockedError(self)
+
+        if merge:
+            for layer in self.kcl.layer_indexes():
+                shapes = self.shapes(layer)
+                if shapes.is_empty():
+                    continue
+                region = kdb.Region(shapes).merge()
+                shapes.clear()
+                shapes.insert(region)
+
     def add_ref(
         self, component: Component, name: str | None = None, alias: str | None = None
     ) -> kf.Instance:
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from functools import partial
 
-import numpy as np
-
 import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.components.straight import straight
@@ -12,6 +10,8 @@ from gdsfactory.cross_section import strip
 from gdsfactory.path import euler
 from gdsfactory.typings import CrossSectionSpec
 
+_BBOX_NO_TOP_ANGLES = frozenset({180, -180, -90})
+
 
 @gf.cell
 def bend_euler(
@@ -73,21 +73,25 @@ def bend_euler(
     p = euler(
         radius=radius, angle=angle, p=p, use_eff=with_arc_floorplan, npoints=npoints
     )
-    ref = c << p.extrude(x)
-    c.add_ports(ref.ports)
-    c.info["length"] = np.round(p.length(), 3)
-    c.info["dy"] = np.round(abs(float(p.points[0][0] - p.points[-1][0])), 3)
-    c.info["radius_min"] = float(np.round(p.info["Rmin"], 3))
-    c.info["radius"] = float(radius)
-
+    extruded = p.extrude(x)
     if direction == "cw":
+        ref = c << extruded
+        c.add_ports(ref.ports)
         ref.mirror(p1=[0, 0], p2=[1, 0])
+    else:
+        c.add_shapes_from(extruded)
+        c.add_ports(extruded.ports)
+    pts = p.points
+    c.info["length"] = round(float(p.length()), 3)
+    c.info["dy"] = round(abs(float(pts[0, 0] - pts[-1, 0])), 3)
+    c.info["radius_min"] = round(float(p.info["Rmin"]), 3)
+    c.info["radius"] = float(radius)
 
     if not allow_min_radius_violation:
         x.validate_radius(radius)
 
-    top = None if int(angle) in {180, -180, -90} else 0
-    bottom = 0 if int(angle) in {-90} else None
+    top = None if int(angle) in _BBOX_NO_TOP_ANGLES else 0
+    bottom = 0 if int(angle) == -90 else None
     x.add_bbox(c, top=top, bottom=bottom)
     c.add_route_info(
         cross_section=x, length=c.info["length"], n_bend_90=abs(angle / 90.0)
@@ -133,8 +137,7 @@ def bend_euler_s(**kwargs) -> Component:
     b = bend_euler(**kwargs)
     b1 = c.add_ref(b)
     b2 = c.add_ref(b)
-    b2.mirror()
-    b2.connect("o1", b1.ports["o2"])
+    b2.connect("o1", b1.ports["o2"], mirror=True)
     c.add_port("o1", port=b1.ports["o1"])
     c.add_port("o2", port=b2.ports["o2"])
     c.info["length"] = 2 * b.info["length"]
@@ -177,8 +180,7 @@ def bend_straight_bend(
     b2 = c.add_ref(b)
     s = c << straight(length=straight_length, cross_section=cross_section)
     s.connect("o1", b1.ports["o2"])
-    b2.mirror()
-    b2.connect("o1", s.ports["o2"])
+    b2.connect("o1", s.ports["o2"], mirror=True)
     c.add_port("o1", port=b1.ports["o1"])
     c.add_port("o2", port=b2.ports["o2"])
     return c
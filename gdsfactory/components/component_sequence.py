@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Iterable
 
 import gdsfactory as gf
 from gdsfactory.component import Component
@@ -54,6 +55,24 @@ def parse_component_name(name: str) -> tuple[str, bool]:
     return (name[1:], True) if len(name) != 1 and name[0] == "!" else (name, False)
 
 
+def _parse_sequence(sequence: str | Iterable[str]) -> list[tuple[str, bool]]:
+    """Returns (symbol, flip) for each component in the sequence.
+
+    A "!" flips the next symbol, either as its own item or as a prefix.
+    A trailing "!" is ignored.
+    """
+    symbols = []
+    do_flip = False
+    for item in sequence:
+        if item == "!":
+            do_flip = True
+            continue
+        name, flip = parse_component_name(item)
+        symbols.append((name, do_flip or flip))
+        do_flip = False
+    return symbols
+
+
 def _flip_ref(c_ref, port_name):
     a = c_ref.ports[port_name].orientation
     if a in [0, 180]:
@@ -65,7 +84,7 @@ def _flip_ref(c_ref, port_name):
 
 
 def component_sequence(
-    sequence: str,
+    sequence: str | Iterable[str],
     symbol_to_component: dict[str, tuple[ComponentSpec, str, str]],
     ports_map: dict[str, tuple[str, str]] | None = None,
     port_name1: str = "o1",
@@ -77,7 +96,7 @@ def component_sequence(
     if you prefix a symbol with ! it mirrors the component
 
     Args:
-        sequence: a string or a list of symbols.
+        sequence: a string or an iterable of symbols.
         symbol_to_component: maps symbols to (component, input, output).
         ports_map: (optional) extra port mapping using the convention.
             {port_name: (alias_name, port_name)}
@@ -113,15 +132,18 @@ def component_sequence(
     """
     ports_map = ports_map or {}
     named_references_counter = Counter()
+    symbols = _parse_sequence(sequence)
+    if not symbols:
+        raise ValueError(f"sequence {sequence!r} has no symbols")
 
     component = Component()
 
     # Add first component reference and input port
-    symbol = sequence[0] if "!" not in sequence[0] else sequence[:2]
-    index = 2 if "!" in sequence[0] else 1
-    name_start_device, do_flip = parse_component_name(symbol)
+    name_start_device, do_flip = symbols[0]
     component_input, input_port, prev_port = symbol_to_component[name_start_device]
-    prev_device = component.add_ref(component_input, name=f"{symbol}{index}")
+    # flipped start references keep their historical "!<symbol>2" name
+    name = f"!{name_start_device}2" if do_flip else f"{name_start_device}1"
+    prev_device = component.add_ref(component_input, name=name)
     named_references_counter.update(
         {name_start_device: 1}
     )  # sourcery skip:simplify-dictionary-update
@@ -139,21 +161,7 @@ def component_sequence(
             f"not in {list(prev_device.ports.keys())}"
         ) from exc
 
-    while index < len(sequence):
-        s = sequence[index]
-
-        if s == "!":
-            # if it's the last character skip
-            if index + 1 >= len(sequence):
-                index += 1
-                continue
-            s = sequence[index + 1]
-            do_flip = True
-            index += 1
-        else:
-            do_flip = False
-
-        index += 1
+    for s, do_flip in symbols[1:]:
         component_i, input_port, next_port = symbol_to_component[s]
         component_i = gf.get_component(component_i)
         named_references_counter.update(
@@ -177,7 +185,7 @@ def component_sequence(
         prev_port = next_port
 
     # Deal with edge case where the sequence contains only one component
-    if len(sequence) == 1:
+    if len(symbols) == 1:
         ref = prev_device
         next_port = prev_port
 
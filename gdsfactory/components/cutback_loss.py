@@ -1,6 +1,4 @@
-from functools import partial
-
-import numpy as np
+from functools import cache, partial
 
 import gdsfactory as gf
 from gdsfactory.components.bend_euler import bend_euler, bend_euler180
@@ -8,12 +6,12 @@ from gdsfactory.components.cutback_bend import cutback_bend90, cutback_bend180
 from gdsfactory.components.cutback_component import cutback_component
 from gdsfactory.components.mmi1x2 import mmi1x2
 from gdsfactory.components.spiral import spiral
-from gdsfactory.typings import ComponentFactory, CrossSectionSpec
+from gdsfactory.typings import CellSpec, ComponentFactory, CrossSectionSpec
 
 
 def cutback_loss(
     component: ComponentFactory = mmi1x2,
-    cutback: ComponentFactory = cutback_component,
+    cutback: CellSpec = cutback_component,
     loss: tuple[float, ...] = (1.0, 2.0, 3.0),
     loss_dB: float = 10e-3,
     cols: int | None = 4,
@@ -24,7 +22,7 @@ def cutback_loss(
 
     Args:
         component: component factory.
-        cutback: cutback function.
+        cutback: cutback function or PDK cell name.
         loss: list of target loss in dB.
         loss_dB: loss per component.
         cols: number of columns.
@@ -43,29 +41,26 @@ def cutback_loss(
         kwargs: component settings.
 
     """
-    loss = np.array(list(loss))
+    cutback = gf.get_cell(cutback)
+
+    @cache
+    def _cutback(rows: int, cols: int) -> gf.Component:
+        return cutback(component=component, rows=rows, cols=cols, **kwargs)
 
     if rows and cols:
         raise ValueError("Specify either cols or rows")
     elif rows is None:
-        rows_list = loss / loss_dB / cols
-        rows_list = rows_list // 2 * 2 + 1
-        return [
-            cutback(component=component, rows=int(rows), cols=cols, **kwargs)
-            for rows in rows_list
-        ]
+        rows_list = [int(loss_i / loss_dB / cols) // 2 * 2 + 1 for loss_i in loss]
+        return [_cutback(rows=rows, cols=cols) for rows in rows_list]
     elif cols is None:
-        cols_list = loss / loss_dB / rows
-        return [
-            cutback(component=component, rows=rows, cols=int(cols), **kwargs)
-            for cols in cols_list
-        ]
+        cols_list = [int(loss_i / loss_dB / rows) for loss_i in loss]
+        return [_cutback(rows=rows, cols=cols) for cols in cols_list]
     else:
         raise ValueError("Specify either cols or rows")
 
 
 def cutback_loss_spirals(
-    spiral: ComponentFactory = spiral,
+    spiral: CellSpec = spiral,
     loss: tuple[float, ...] = tuple(4 + 3 * i for i in range(3)),
     cross_section: CrossSectionSpec = "xs_sc",
     loss_dB_per_m: float = 300,
@@ -74,17 +69,20 @@ def cutback_loss_spirals(
     """Returns a list of spirals.
 
     Args:
-        spiral: spiral factory.
+        spiral: spiral factory or PDK cell name.
         loss: list of target loss in dB.
         cross_section: strip or rib.
         loss_dB_per_m: loss per meter.
         kwargs: additional spiral arguments.
     """
+    spiral = gf.get_cell(spiral)
+
+    @cache
+    def _spiral(length: float) -> gf.Component:
+        return spiral(length=length, cross_section=cross_section, **kwargs)
+
     lengths = [loss_dB / loss_dB_per_m * 1e6 for loss_dB in loss]
-    return [
-        spiral(length=length, cross_section=cross_section, **kwargs)
-        for length in lengths
-    ]
+    return [_spiral(length=length) for length in lengths]
 
 
 cutback_loss_mmi1x2 = partial(cutback_loss, component=mmi1x2, port2="o3", mirror2=True)
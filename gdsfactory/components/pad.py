@@ -3,12 +3,17 @@ from __future__ import annotations
 import warnings
 from functools import partial
 
+import numpy as np
+
 import gdsfactory as gf
 from gdsfactory import cell
 from gdsfactory.component import Component
 from gdsfactory.components.compass import compass
 from gdsfactory.typings import ComponentFactory, Float2, LayerSpec
 
+_HORIZONTAL_ORIENTATIONS = frozenset({0, 180})
+_VERTICAL_ORIENTATIONS = frozenset({90, 270})
+
 
 @cell
 def pad(
@@ -36,27 +41,25 @@ def pad(
     rect = compass(
         size=size, layer=layer, port_inclusion=port_inclusion, port_type="electrical"
     )
-    c_ref = c.add_ref(rect)
-    c.add_ports(c_ref.ports)
+    c.add_shapes_from(rect)
+    c.add_ports(rect.ports)
     c.info["size"] = size
     c.info["xsize"] = size[0]
     c.info["ysize"] = size[1]
 
     if bbox_layers and bbox_offsets:
-        sizes = []
-        for cladding_offset in bbox_offsets:
-            size = (size[0] + 2 * cladding_offset, size[1] + 2 * cladding_offset)
-            sizes.append(size)
+        offsets = 2 * np.asarray(bbox_offsets, dtype=float)
+        sizes = np.column_stack([size[0] + offsets, size[1] + offsets]).tolist()
 
-        for layer, size in zip(bbox_layers, sizes):
-            c.add_ref(
+        for bbox_layer, bbox_size in zip(bbox_layers, sizes):
+            c.add_shapes_from(
                 compass(
-                    size=size,
-                    layer=layer,
+                    size=tuple(bbox_size),
+                    layer=bbox_layer,
                 )
             )
 
-    width = size[1] if port_orientation in {0, 180} else size[0]
+    width = size[1] if port_orientation in _HORIZONTAL_ORIENTATIONS else size[0]
 
     c.add_port(
         name="pad",
@@ -106,18 +109,20 @@ def pad_array(
     pad = pad(size=size, port_orientation=port_orientation, layer=layer)
 
     c.add_array(pad, columns=columns, rows=rows, spacing=spacing)
-    width = size[0] if port_orientation in {90, 270} else size[1]
-
-    for col in range(columns):
-        for row in range(rows):
-            c.add_port(
-                name=f"e{row+1}{col+1}",
-                center=(col * spacing[0], row * spacing[1]),
-                width=width,
-                orientation=port_orientation,
-                port_type="electrical",
-                layer=layer,
-            )
+    width = size[0] if port_orientation in _VERTICAL_ORIENTATIONS else size[1]
+
+    cols_idx, rows_idx = np.meshgrid(np.arange(columns), np.arange(rows), indexing="ij")
+    cols_idx, rows_idx = cols_idx.ravel(), rows_idx.ravel()
+    centers = np.stack([cols_idx * spacing[0], rows_idx * spacing[1]], axis=1)
+    names = [f"e{row + 1}{col + 1}" for col, row in zip(cols_idx, rows_idx)]
+    c.add_ports_from_arrays(
+        names=names,
+        centers=centers,
+        width=width,
+        orientation=port_orientation,
+        port_type="electrical",
+        layer=layer,
+    )
     return c
 
 
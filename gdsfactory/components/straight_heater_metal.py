@@ -8,6 +8,53 @@ from gdsfactory.component import Component
 from gdsfactory.typings import ComponentSpec, CrossSectionSpec
 
 
+def _port_names_by_orientation(
+    component: Component,
+) -> dict[float | None, list[str]]:
+    """Returns port names grouped by orientation.
+
+    None maps to all the port names, as in `ports.filter(orientation=None)`.
+    """
+    port_names: dict[float | None, list[str]] = {None: []}
+    for port in component.ports:
+        port_names[None].append(port.name)
+        port_names.setdefault(port.orientation, []).append(port.name)
+    return port_names
+
+
+def _port_distance(component: Component) -> float:
+    """Returns the x distance from port o1 to port o2."""
+    return component.ports["o2"].d.x - component.ports["o1"].d.x
+
+
+@cell
+def _undercut_period(
+    length_undercut: float,
+    length_undercut_spacing: float,
+    cross_section_undercut: CrossSectionSpec,
+    cross_section_spacing: CrossSectionSpec,
+) -> Component:
+    """Returns one undercut section followed by its spacing section.
+
+    Args:
+        length_undercut: length of the undercut section.
+        length_undercut_spacing: length of the spacing section.
+        cross_section_undercut: for the undercut section.
+        cross_section_spacing: for the spacing section.
+    """
+    c = Component()
+    s_uc = c << gf.components.straight(
+        cross_section=cross_section_undercut, length=length_undercut
+    )
+    s_spacing = c << gf.components.straight(
+        cross_section=cross_section_spacing, length=length_undercut_spacing
+    )
+    s_spacing.connect("o1", s_uc.ports["o2"])
+    c.add_port("o1", port=s_uc.ports["o1"])
+    c.add_port("o2", port=s_spacing.ports["o2"])
+    return c
+
+
 @cell
 def straight_heater_metal_undercut(
     length: float = 320.0,
@@ -77,33 +124,44 @@ def straight_heater_metal_undercut(
         cross_section=cross_section_undercut,
         length=length_undercut,
     )
-    s_spacing = gf.components.straight(
-        cross_section=cross_section_waveguide_heater,
-        length=length_undercut_spacing,
-    )
-    symbol_to_component = {
-        "_": (s_ports, "o1", "o2"),
-        "-": (s_si, "o1", "o2"),
-        "U": (s_uc, "o1", "o2"),
-        "H": (s_spacing, "o1", "o2"),
-    }
 
-    # Each character in the sequence represents a component
-    sequence = "_-" + n * "UH" + "-_"
+    # The repeated undercut + spacing section is a single cell placed as an array
+    if length_undercut_spacing > 0:
+        undercut_period = _undercut_period(
+            length_undercut=length_undercut,
+            length_undercut_spacing=length_undercut_spacing,
+            cross_section_undercut=cross_section_undercut,
+            cross_section_spacing=cross_section_waveguide_heater,
+        )
+    else:
+        undercut_period = s_uc
+    undercut_period_length = _port_distance(undercut_period)
 
+    # zero length sections have no geometry, only their ports are needed
     c = Component()
-    sequence = gf.components.component_sequence(
-        sequence=sequence, symbol_to_component=symbol_to_component
-    )
-    c.add_ref(sequence)
-    c.add_ports(sequence.ports)
+    x_offset = 0.0
+    if length_straight > 0:
+        c.add_ref(s_ports)
+    c.add_port("o1", port=s_ports.ports["o1"])
+    x_offset += _port_distance(s_ports)
+    c.add_ref(s_si).d.movex(x_offset)
+    x_offset += _port_distance(s_si)
+    c.add_array(
+        undercut_period, columns=n, rows=1, spacing=(undercut_period_length, 0)
+    ).d.movex(x_offset)
+    x_offset += n * undercut_period_length
+    c.add_ref(s_si).d.movex(x_offset)
+    x_offset += _port_distance(s_si)
+    if length_straight > 0:
+        c.add_ref(s_ports).d.movex(x_offset)
+    c.add_port("o2", port=s_ports.ports["o2"].copy(gf.kdb.DCplxTrans(x_offset, 0)))
 
     x = gf.get_cross_section(cross_section_heater)
     heater_width = x.width
 
     if via_stack:
         via_stack = gf.get_component(via_stack)
-        dx = via_stack.d.xsize / 2 + heater_taper_length or 0
+        dx = via_stack.d.xsize / 2 + (heater_taper_length or 0)
         dx -= length_straight
 
         via_stack_west = c << via_stack
@@ -112,9 +170,14 @@ def straight_heater_metal_undercut(
         via_stack_west.d.movex(-dx)
         via_stack_east.d.movex(+dx + length)
 
-        valid_orientations = {p.orientation for p in via_stack.ports}
-        p1 = list(via_stack_west.ports.filter(orientation=port_orientation1))
-        p2 = list(via_stack_east.ports.filter(orientation=port_orientation2))
+        port_names = _port_names_by_orientation(via_stack)
+        valid_orientations = set(port_names) - {None}
+        p1 = [
+            via_stack_west.ports[name] for name in port_names.get(port_orientation1, [])
+        ]
+        p2 = [
+            via_stack_east.ports[name] for name in port_names.get(port_orientation2, [])
+        ]
 
         if not p1:
             raise ValueError(
@@ -190,7 +253,7 @@ def straight_heater_metal_simple(
 
     if via_stack:
         via = via_stackw = via_stacke = gf.get_component(via_stack)
-        dx = via_stackw.d.xsize / 2 + heater_taper_length or 0
+        dx = via_stackw.d.xsize / 2 + (heater_taper_length or 0)
         via_stack_west_center = (
             straight_heater_section.d.xmin - dx,
             straight_heater_section.d.y,
@@ -205,9 +268,14 @@ def straight_heater_metal_simple(
         via_stack_west.d.move(via_stack_west_center)
         via_stack_east.d.move(via_stack_east_center)
 
-        valid_orientations = {p.orientation for p in via.ports}
-        p1 = via_stack_west.ports.filter(orientation=port_orientation1)
-        p2 = via_stack_east.ports.filter(orientation=port_orientation2)
+        port_names = _port_names_by_orientation(via)
+        valid_orientations = set(port_names) - {None}
+        p1 = [
+            via_stack_west.ports[name] for name in port_names.get(port_orientation1, [])
+        ]
+        p2 = [
+            via_stack_east.ports[name] for name in port_names.get(port_orientation2, [])
+        ]
 
         if not p1:
             raise ValueError(
@@ -2,13 +2,89 @@ from __future__ import annotations
 
 from functools import partial
 
+import numpy as np
+from kfactory import kdb
+
 import gdsfactory as gf
 from gdsfactory import cell
 from gdsfactory.component import Component
+from gdsfactory.cross_section import Section
 from gdsfactory.port import Port
 from gdsfactory.typings import CrossSectionSpec, LayerSpec
 
 
+def _taper_points(
+    length: float,
+    widths: np.ndarray,
+    offsets: np.ndarray,
+    delta_width: float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Returns (N, 4, 2) polygon points for N sections tapered by delta_width.
+
+    Args:
+        length: taper length.
+        widths: width of each section at the start of the taper.
+        offsets: center offset of each section.
+        delta_width: width change along the taper.
+        out: optional (N, 4, 2) array to write the points into.
+    """
+    y1 = widths / 2
+    y2 = widths / 2 + delta_width / 2
+    points = np.empty((len(widths), 4, 2)) if out is None else out
+    points[:, :, 0] = (0, length, length, 0)
+    points[:, :, 1] = np.stack([y1, y2, -y2, -y1], axis=1) - offsets[:, None]
+    return points
+
+
+def _to_dbu_polygons(points: np.ndarray, dbu: float) -> list[kdb.Polygon]:
+    """Returns integer polygons from (N, M, 2) points in um.
+
+    Rounds half away from zero like klayout does when inserting a DPolygon.
+    """
+    coords = np.sign(points) * np.floor(np.abs(points) * (1 / dbu) + 0.5)
+    return [
+        kdb.Polygon([kdb.Point(x, y) for x, y in polygon])
+        for polygon in coords.astype(np.int64).tolist()
+    ]
+
+
+def _add_taper_polygons(
+    component: Component,
+    length: float,
+    width1: float,
+    width2: float,
+    layer: LayerSpec,
+    sections: tuple[Section, ...],
+) -> None:
+    """Adds a linear taper on layer, with its extra sections, to a component."""
+    y1 = width1 / 2
+    y2 = width2 / 2
+    points = np.empty((len(sections) + 1, 4, 2))
+    points[0] = [(0, y1), (length, y2), (length, -y2), (0, -y1)]
+    layers = [layer]
+    if sections:
+        section_layers, widths, offsets = zip(
+            *((s.layer, s.width, s.offset or 0.0) for s in sections)
+        )
+        layers.extend(section_layers)
+        _taper_points(
+            length=length,
+            widths=np.array(widths, dtype=float),
+            offsets=np.array(offsets, dtype=float),
+            delta_width=width2 - width1,
+            out=points[1:],
+        )
+
+    polygons_by_layer: dict[int, list[kdb.Polygon]] = {}
+    polygons = _to_dbu_polygons(points, component.kcl.dbu)
+    for layer, polygon in zip(layers, polygons):
+        polygons_by_layer.setdefault(gf.get_layer(layer), []).append(polygon)
+
+    for layer, polygons in polygons_by_layer.items():
+        component.add_polygon(kdb.Region(polygons), layer=layer)
+
+
 @cell
 def taper(
     length: float = 10.0,
@@ -42,52 +118,24 @@ def taper(
         kwargs: cross_section settings.
     """
     x1 = gf.get_cross_section(cross_section, width=width1)
-    if width2:
-        width2 = gf.snap.snap_to_grid2x(width2)
-        x2 = gf.get_cross_section(cross_section, width=width2)
-    else:
-        x2 = x1
-
     width1 = x1.width
-    width2 = x2.width
-    width_max = max([width1, width2])
-    x = gf.get_cross_section(cross_section, width=width_max, **kwargs)
+    width2 = gf.snap.snap_to_grid2x(width2) if width2 else width1
+
+    width_max = max(width1, width2)
+    if width_max == width1 and not kwargs:
+        x = x1
+    else:
+        x = gf.get_cross_section(cross_section, width=width_max, **kwargs)
     layer = x.layer
 
     if isinstance(port, gf.Port) and width1 is None:
         width1 = port.width
 
-    width2 = width2 or width1
     c = gf.Component()
-    y1 = width1 / 2
-    y2 = width2 / 2
-
-    delta_width = width2 - width1
-
-    y1 = width1 / 2
-    y2 = width2 / 2
-
     if length:
-        xpts = [0, length, length, 0]
-        ypts = [y1, y2, -y2, -y1]
-        c.add_polygon((xpts, ypts), layer=layer)
-
-        xpts = [0, length, length, 0]
-        for section in x.sections[1:]:
-            layer = section.layer
-            y1 = section.width / 2
-            if not section.offset:
-                y2 = section.width / 2 + delta_width / 2
-                ypts = [y1, y2, -y2, -y1]
-            else:
-                y2 = section.width / 2
-                y2 = section.width / 2 + delta_width / 2
-                ypts = [y1, y2, -y2, -y1]
-                ypts = [y - section.offset for y in ypts]
-            c.add_polygon((xpts, ypts), layer=layer)
-
-    if with_bbox:
-        x.add_bbox(c)
+        _add_taper_polygons(c, length, width1, width2, layer, x.sections[1:])
+        if with_bbox:
+            x.add_bbox(c)
     c.add_port(
         name=port_names[0],
         center=(0, 0),
@@ -104,11 +152,9 @@ def taper(
             width=width2,
             orientation=0,
             layer=x.layer,
-            cross_section=x2,
             port_type=port_types[1],
         )
 
-    x.add_bbox(c)
     c.info["length"] = length
     c.info["width1"] = float(width1)
     c.info["width2"] = float(width2)
@@ -156,33 +202,30 @@ def taper_strip_to_ridge(
 
     """
     xs = gf.get_cross_section(cross_section, **kwargs)
-    xs_wg = xs.copy(layer=layer_wg)
-    xs_slab = xs.copy(layer=layer_slab)
-
-    taper_wg = taper(
-        length=length,
-        width1=width1,
-        width2=width2,
-        cross_section=xs_wg,
-    )
-    taper_slab = taper(
-        length=length,
-        width1=w_slab1,
-        width2=w_slab2,
-        cross_section=xs_slab,
-        with_bbox=False,
-    )
+    width2 = gf.snap.snap_to_grid2x(width2) if width2 else width1
+    w_slab2 = gf.snap.snap_to_grid2x(w_slab2) if w_slab2 else w_slab1
+    sections = xs.sections[1:]
 
+    # waveguide and slab tapers are drawn straight into c, without subcells
     c = gf.Component()
-    taper_ref_wg = c << taper_wg
-    taper_ref_slab = c << taper_slab
+    if length:
+        _add_taper_polygons(c, length, width1, width2, layer_wg, sections)
+        _add_taper_polygons(c, length, w_slab1, w_slab2, layer_slab, sections)
 
     c.info["length"] = float(length)
-    c.add_port(name="o1", port=taper_ref_wg.ports["o1"])
+    c.add_port(name="o1", center=(0, 0), width=width1, orientation=180, layer=layer_wg)
     if use_slab_port:
-        c.add_port(name="o2", port=taper_ref_slab.ports["o2"])
+        c.add_port(
+            name="o2",
+            center=(length, 0),
+            width=w_slab2,
+            orientation=0,
+            layer=layer_slab,
+        )
     else:
-        c.add_port(name="o2", port=taper_ref_wg.ports["o2"])
+        c.add_port(
+            name="o2", center=(length, 0), width=width2, orientation=0, layer=layer_wg
+        )
 
     if length:
         xs.add_bbox(c)
@@ -217,18 +260,22 @@ def taper_strip_to_ridge_trenches(
     # straight
     x = [0, length, length, 0]
     yw = [y0, yL, -yL, -y0]
-    c.add_polygon(list(zip(x, yw)), layer=layer_wg)
 
-    # top trench
+    # top and bottom trenches
     ymin0 = width / 2
     yminL = width / 2
     ymax0 = width / 2 + trench_width
     ymaxL = width / 2 + trench_width + slab_offset
-    x = [0, length, length, 0]
     ytt = [ymin0, yminL, ymaxL, ymax0]
     ytb = [-ymin0, -yminL, -ymaxL, -ymax0]
-    c.add_polygon(list(zip(x, ytt)), layer=trench_layer)
-    c.add_polygon(list(zip(x, ytb)), layer=trench_layer)
+
+    points = np.empty((3, 4, 2))
+    points[:, :, 0] = x
+    points[:, :, 1] = [yw, ytt, ytb]
+    wg, trench_top, trench_bot = _to_dbu_polygons(points, c.kcl.dbu)
+    c.add_polygon(wg, layer=layer_wg)
+    c.add_polygon(trench_top, layer=trench_layer)
+    c.add_polygon(trench_bot, layer=trench_layer)
 
     c.add_port(name="o1", center=(0, 0), width=width, orientation=180, layer=layer_wg)
     c.add_port(
@@ -212,7 +212,7 @@ class CrossSection(BaseModel):
     components_along_path: tuple[ComponentAlongPath, ...] = Field(default_factory=tuple)
     radius: float | None = None
     radius_min: float | None = None
-    bbox_layers: LayerSpecs | None = None
+    bbox_layers: tuple[LayerSpec, ...] | None = None
     bbox_offsets: Floats | None = None
 
     model_config = ConfigDict(extra="forbid", frozen=True)
@@ -1,9 +1,13 @@
 """Converts CSV of test site labels into a CSV test manifest."""
 
-import pandas as pd
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import gdsfactory as gf
-from gdsfactory.samples.sample_reticle import sample_reticle
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def get_test_manifest(
@@ -16,6 +20,8 @@ def get_test_manifest(
         component: Component to extract test manifest from.
         one_setting_per_column: If True, puts each cell setting in a separate column.
     """
+    import pandas as pd
+
     rows = []
     ports = component.get_ports_list()
     name_to_settings = {}
@@ -74,6 +80,8 @@ def get_test_manifest(
 
 
 if __name__ == "__main__":
+    from gdsfactory.samples.sample_reticle import sample_reticle
+
     c = sample_reticle()
     # c = gf.pack([c])[0]
     c.show()
@@ -1269,17 +1269,105 @@ def _cumtrapz(x):
     return np.cumsum((x[1:] + x[:-1]) / 2)
 
 
-def _fresnel(R0, s, num_pts, n_iter=8):
-    """Fresnel integral using a series expansion."""
+def _fresnel_coefficients(n_iter: int) -> tuple[np.ndarray, np.ndarray]:
+    """Returns exponents and coefficients of the Fresnel series expansion.
+
+    Each row holds the (x, y) term for one order of the expansion.
+    """
+    n = np.arange(n_iter)
+    exponents = np.stack([4 * n + 1, 4 * n + 3])
+    factorials = np.array(
+        [
+            [math.factorial(2 * i) for i in range(n_iter)],
+            [math.factorial(2 * i + 1) for i in range(n_iter)],
+        ],
+        dtype=float,
+    )
+    coefficients = (-1.0) ** n / (factorials * exponents)
+    return exponents, coefficients
+
+
+_FRESNEL_N_ITER = 8
+_FRESNEL_EXPONENTS, _FRESNEL_COEFFICIENTS = _fresnel_coefficients(_FRESNEL_N_ITER)
+
+
+def _fresnel(R0, s, num_pts, n_iter=_FRESNEL_N_ITER):
+    """Fresnel integral using a series expansion.
+
+    All `num_pts` samples are evaluated at once by broadcasting the powers of
+    the series, returning a (2, num_pts) array with the x and y coordinates.
+    """
+    if n_iter == _FRESNEL_N_ITER:
+        exponents, coefficients = _FRESNEL_EXPONENTS, _FRESNEL_COEFFICIENTS
+    else:
+        exponents, coefficients = _fresnel_coefficients(n_iter)
+
     t = np.linspace(0, s / (np.sqrt(2) * R0), num_pts)
-    x = np.zeros(num_pts)
-    y = np.zeros(num_pts)
+    terms = t[np.newaxis, :, np.newaxis] ** exponents[:, np.newaxis, :]
+    xy = np.einsum("ijk,ik->ij", terms, coefficients)
+    return np.sqrt(2) * R0 * xy
+
+
+def _euler_core(
+    xbend1: np.ndarray,
+    ybend1: np.ndarray,
+    dx: float,
+    dy: float,
+    Rp: float,
+    sp: float,
+    s0: float,
+    p: float,
+    alpha: float,
+    angle: float,
+    num_pts_arc: int,
+    radius: float,
+    use_eff: bool,
+) -> tuple[np.ndarray, float, float]:
+    """Returns the (N, 2) points, Reff and Rmin of a (partial) euler bend.
+
+    Joins the euler section given by its Fresnel coordinates with the constant
+    curvature arc, mirrors it to build the second half of the bend and scales
+    the curve to match `radius`.
+    """
+    s = np.linspace(sp, s0 / 2, num_pts_arc)
+    xbend2 = Rp * np.sin((s - sp) / Rp + p * alpha / 2) + dx
+    ybend2 = Rp * (1 - np.cos((s - sp) / Rp + p * alpha / 2)) + dy
 
-    for n in range(n_iter):
-        x += (-1) ** n * t ** (4 * n + 1) / (math.factorial(2 * n) * (4 * n + 1))
-        y += (-1) ** n * t ** (4 * n + 3) / (math.factorial(2 * n + 1) * (4 * n + 3))
+    x = np.concatenate((xbend1, xbend2[1:]))
+    y = np.concatenate((ybend1, ybend2[1:]))
+    n = x.size
+
+    # second half is the first half flipped and rotated by `angle - 180`
+    x2 = x[::-1].copy()
+    y2 = -y[::-1]
+    if angle != 180:
+        a = (angle - 180) * np.pi / 180
+        ca = np.cos(a)
+        sa = np.sin(a)
+        x2, y2 = x2 * ca + y2 * -sa, y2 * ca + x2 * sa
+    x2 += -x2[0] + x[-1]
+    y2 += -y2[0] + y[-1]
+
+    points = np.empty((2 * n - 1, 2))
+    points[: n - 1, 0] = x[:-1]
+    points[: n - 1, 1] = y[:-1]
+    points[n - 1 :, 0] = x2
+    points[n - 1 :, 1] = y2
 
-    return np.array([np.sqrt(2) * R0 * x, np.sqrt(2) * R0 * y])
+    # Find y-axis intersection point to compute Reff
+    start_angle = 180 * (angle < 0)
+    end_angle = start_angle + angle
+    dy = np.tan(np.radians(end_angle - 90)) * points[-1, 0]
+    Reff = points[-1, 1] - dy
+    Rmin = Rp
+
+    # Fix degenerate condition at angle == 180
+    if np.abs(180 - angle) < 1e-3:
+        Reff = points[-1, 1] / 2
+
+    # Scale curve to either match Reff or Rmin
+    scale = radius / Reff if use_eff else radius / Rmin
+    return points * scale, Reff * scale, Rmin * scale
 
 
 def euler(
@@ -1355,38 +1443,27 @@ def euler(
         dx = xp - Rp * np.sin(p * alpha / 2)
         dy = yp - Rp * (1 - np.cos(p * alpha / 2))
     else:
-        xbend1 = ybend1 = np.asfarray([])
-        dx = 0
-        dy = 0
-
-    s = np.linspace(sp, s0 / 2, num_pts_arc)
-    xbend2 = Rp * np.sin((s - sp) / Rp + p * alpha / 2) + dx
-    ybend2 = Rp * (1 - np.cos((s - sp) / Rp + p * alpha / 2)) + dy
-
-    x = np.concatenate([xbend1, xbend2[1:]])
-    y = np.concatenate([ybend1, ybend2[1:]])
-    points1 = np.array([x, y]).T
-    points2 = np.flipud(np.array([x, -y]).T)
-
-    points2 = _rotate_points(points2, angle - 180)
-    points2 += -points2[0, :] + points1[-1, :]
-
-    points = np.concatenate([points1[:-1], points2])
-
-    # Find y-axis intersection point to compute Reff
+        xbend1 = ybend1 = np.zeros(0)
+        dx = 0.0
+        dy = 0.0
+
+    points, Reff, Rmin = _euler_core(
+        xbend1,
+        ybend1,
+        float(dx),
+        float(dy),
+        float(Rp),
+        float(sp),
+        float(s0),
+        float(p),
+        float(alpha),
+        float(angle),
+        num_pts_arc,
+        float(radius),
+        bool(use_eff),
+    )
     start_angle = 180 * (angle < 0)
     end_angle = start_angle + angle
-    dy = np.tan(np.radians(end_angle - 90)) * points[-1][0]
-    Reff = points[-1][1] - dy
-    Rmin = Rp
-
-    # Fix degenerate condition at angle == 180
-    if np.abs(180 - angle) < 1e-3:
-        Reff = points[-1][1] / 2
-
-    # Scale curve to either match Reff or Rmin
-    scale = radius / Reff if use_eff else radius / Rmin
-    points *= scale
 
     P = Path()
 
@@ -1394,8 +1471,8 @@ def euler(
     P.points = points
     P.start_angle = start_angle
     P.end_angle = end_angle
-    P.info["Reff"] = Reff * scale
-    P.info["Rmin"] = Rmin * scale
+    P.info["Reff"] = Reff
+    P.info["Rmin"] = Rmin
     if mirror:
         P.mirror((1, 0))
     return P
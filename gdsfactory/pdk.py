@@ -5,6 +5,7 @@ from __future__ import annotations
 import importlib
 import pathlib
 import warnings
+from collections import OrderedDict
 from collections.abc import Callable
 from functools import partial
 from typing import Any
@@ -14,7 +15,7 @@ import numpy as np
 import omegaconf
 from kfactory import LayerEnum
 from omegaconf import DictConfig
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from gdsfactory.config import CONF, logger
 from gdsfactory.read.from_yaml_template import cell_from_yaml_template
@@ -49,6 +50,7 @@ constants = {
 }
 
 nm = 1e-3
+cross_section_cache_size = 256
 
 
 def evanescent_coupler_sample() -> None:
@@ -165,6 +167,9 @@ class Pdk(BaseModel):
     bend_points_distance: float = 20 * nm
     connectivity: list[ConnectivitySpec] | None = None
     max_cellname_length: int = CONF.max_cellname_length
+    _cross_section_cache: OrderedDict[
+        tuple[Any, ...], tuple[CrossSectionOrFactory, CrossSection]
+    ] = PrivateAttr(default_factory=OrderedDict)
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -376,7 +381,23 @@ class Pdk(BaseModel):
                 cross_sections = list(self.cross_sections.keys())
                 raise ValueError(f"{cross_section!r} not in {cross_sections}")
             xs = self.cross_sections[cross_section]
-            return xs(**kwargs) if callable(xs) else xs.copy(**kwargs)
+            # cross_sections are frozen, so they can be shared between calls.
+            # Keyed on the factory too, in case the entry is replaced, and on
+            # the settings types so that 5 and 5.0 do not share an entry.
+            # The least recently used entries are dropped past the cache size.
+            key = (cross_section, *((k, type(v), v) for k, v in sorted(kwargs.items())))
+            cache = self._cross_section_cache
+            try:
+                cached = cache.get(key)
+            except TypeError:  # unhashable settings
+                return xs(**kwargs) if callable(xs) else xs.copy(**kwargs)
+            if cached is None or cached[0] is not xs:
+                cached = (xs, xs(**kwargs) if callable(xs) else xs.copy(**kwargs))
+                cache[key] = cached
+                if len(cache) > cross_section_cache_size:
+                    cache.popitem(last=False)
+            cache.move_to_end(key)
+            return cached[1]
         elif isinstance(cross_section, dict | DictConfig):
             xs_name = cross_section.get("cross_section", None)
             settings = cross_section.get("settings", {})
@@ -548,7 +569,8 @@ def get_cross_section(
 
 
 def get_layer(layer: LayerSpec) -> Layer:
-    return get_active_pdk().get_layer(layer)
+    """Returns layer index from a layer spec. Layer indexes are returned as is."""
+    return layer if isinstance(layer, int) else get_active_pdk().get_layer(layer)
 
 
 def get_layer_views() -> LayerViews:
@@ -31,6 +31,7 @@ from __future__ import annotations
 
 import csv
 import functools
+import itertools
 import typing
 import warnings
 from collections.abc import Callable
@@ -77,18 +78,9 @@ def pprint_ports(ports: list[Port] | kf.Ports) -> None:
         table.add_column(key)
 
     for port in ports:
-        row = [
-            str(i)
-            for i in [
-                port.name,
-                port.d.width,
-                port.d.angle,
-                port.layer,
-                port.d.center,
-                port.port_type,
-            ]
-        ]
-        table.add_row(*row)
+        d = port.d
+        row = (port.name, d.width, d.angle, port.layer, d.center, port.port_type)
+        table.add_row(*map(str, row))
 
     console.print(table)
 
@@ -121,7 +113,7 @@ class Port(kf.Port):
     ) -> None:
         from gdsfactory.pdk import get_layer
 
-        orientation = np.mod(orientation, 360) if orientation else orientation
+        orientation = orientation % 360 if orientation is not None else None
 
         if cross_section is None and layer is None:
             raise ValueError("You need to define Port cross_section or layer")
@@ -204,12 +196,14 @@ def port_array(
         n: number of ports in the array.
 
     """
-    pitch = np.array(pitch)
+    cx, cy = center
+    px, py = pitch
+    offset = (n - 1) / 2
     return [
         Port(
             name=str(i),
             width=width,
-            center=np.array(center) + i * pitch - (n - 1) / 2 * pitch,
+            center=(cx + i * px - offset * px, cy + i * py - offset * py),
             orientation=orientation,
             **kwargs,
         )
@@ -233,13 +227,30 @@ def read_port_markers(component: object, layers: LayerSpecs = ("PORT",)) -> Comp
 
 def csv2port(csvpath) -> dict[str, Port]:
     """Reads ports from a CSV file and returns a Dict."""
-    ports = {}
-    with open(csvpath) as csvfile:
+    with open(csvpath, newline="", encoding="utf-8") as csvfile:
         rows = csv.reader(csvfile, delimiter=",", quotechar="|")
-        for row in rows:
-            ports[row[0]] = row[1:]
+        return {row[0]: row[1:] for row in rows}
 
-    return ports
+
+def _sort_ports_by_direction(ports: kf.Ports, clockwise: bool) -> list[Port]:
+    """Returns ports grouped by side and sorted along each side.
+
+    The side of each port comes from its angle (0=E, 1=N, 2=W, 3=S).
+    """
+    port_list = list(ports)
+    if not port_list:
+        return []
+
+    angle, x, y = np.array(
+        [(t.angle, t.disp.x, t.disp.y) for t in (p.trans for p in port_list)],
+        dtype=np.int64,
+    ).T
+    # counter-clockwise: E south to north, N east to west, W north to south, S west to east
+    key = np.where(angle % 2, x, y) * np.array([1, -1, -1, 1])[angle]
+    side_order = np.array([2, 1, 0, 3] if clockwise else [0, 1, 2, 3])
+    rank = np.argsort(side_order)[angle]
+    index = np.lexsort((-key if clockwise else key, rank))
+    return [port_list[i] for i in index]
 
 
 def sort_ports_clockwise(ports: kf.Ports) -> kf.Ports:
@@ -256,34 +267,7 @@ def sort_ports_clockwise(ports: kf.Ports) -> kf.Ports:
             8   7
 
     """
-    port_list = ports
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
-
-    for p in port_list:
-        angle = p.angle * 90
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
-
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.y)  # sort north to south
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.x)  # sort west to east
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.y)  # sort south to north
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.x)  # sort east to west
-
-    ports = west_ports + north_ports + east_ports + south_ports
-    return list(ports)
+    return _sort_ports_by_direction(ports, clockwise=True)
 
 
 def sort_ports_counter_clockwise(ports: kf.Ports) -> kf.Ports:
@@ -300,34 +284,7 @@ def sort_ports_counter_clockwise(ports: kf.Ports) -> kf.Ports:
             7   8
 
     """
-    port_list = list(ports)
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
-
-    for p in port_list:
-        angle = p.angle * 90
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
-
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: +p.y)  # sort south to north
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: -p.x)  # sort east to west
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: -p.y)  # sort north to south
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: +p.x)  # sort west to east
-
-    ports = east_ports + north_ports + west_ports + south_ports
-    return list(ports)
+    return _sort_ports_by_direction(ports, clockwise=False)
 
 
 def select_ports(
@@ -354,6 +311,7 @@ def select_ports(
         width: select ports with port width.
         layers_excluded: List of layers to exclude.
         port_type: select ports with port type (optical, electrical, vertical_te).
+        names: select ports with these names. Ports keep their order.
         clockwise: if True, sort ports clockwise, False: counter-clockwise.
         sort_ports: if True, sort ports.
 
@@ -367,27 +325,38 @@ def select_ports(
     if isinstance(ports, kf.Instance):
         ports = ports.ports
 
+    filters: list[Callable[[kf.Port], bool]] = []
     if layer:
         from gdsfactory.pdk import get_layer
 
-        layer = get_layer(layer)
-        ports = [p for p in ports if get_layer(p.layer) == layer]
+        # port layers are already layer indexes
+        layer_index = get_layer(layer)
+        filters.append(lambda p: p.layer == layer_index)
 
     if prefix:
-        ports = [p for p in ports if p.name.startswith(prefix)]
+        filters.append(lambda p: p.name.startswith(prefix))
     if suffix:
-        ports = [p for p in ports if p.name.endswith(suffix)]
+        filters.append(lambda p: p.name.endswith(suffix))
     if orientation is not None:
-        ports = [p for p in ports if np.isclose(p.d.angle, orientation)]
+        # same tolerance as np.isclose
+        atol = 1e-8 + 1e-5 * abs(orientation)
+        filters.append(lambda p: abs(p.d.angle - orientation) <= atol)
 
     if layers_excluded:
-        ports = [p for p in ports if p.layer not in layers_excluded]
+        filters.append(lambda p: p.layer not in layers_excluded)
     if width:
-        ports = [p for p in ports if p.width == width]
+        filters.append(lambda p: p.width == width)
     if port_type:
-        ports = [p for p in ports if p.port_type == port_type]
+        filters.append(lambda p: p.port_type == port_type)
     if names:
-        ports = [p for p in ports if p.name in names]
+        names_set = set(names)
+        filters.append(lambda p: p.name in names_set)
+
+    if filters:
+        # chained lazy filters still walk the ports only once
+        for f in filters:
+            ports = filter(f, ports)
+        ports = list(ports)
 
     if sort_ports:
         if clockwise:
@@ -426,6 +395,18 @@ def move_copy(port, x: int = 0, y: int = 0) -> Port:
     return _port
 
 
+def _port_direction(orientation: float) -> str:
+    """Returns the side (E, N, W, S) that a port with orientation in degrees faces."""
+    angle = orientation % 360
+    if angle <= 45 or angle >= 315:
+        return "E"
+    elif angle <= 135:
+        return "N"
+    elif angle <= 225:
+        return "W"
+    return "S"
+
+
 def get_ports_facing(ports: list[Port], direction: str = "W") -> list[Port]:
     from gdsfactory.component import Component, ComponentReference
 
@@ -442,15 +423,7 @@ def get_ports_facing(ports: list[Port], direction: str = "W") -> list[Port]:
     direction_ports: dict[str, list[Port]] = {x: [] for x in ["E", "N", "W", "S"]}
 
     for p in ports:
-        angle = p.orientation % 360 if p.orientation is not None else 0
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
+        direction_ports[_port_direction(p.orientation or 0)].append(p)
 
     return direction_ports[direction]
 
@@ -471,14 +444,12 @@ def _rename_ports_facing_side(
     """Renames ports clockwise."""
     for direction, list_ports in list(direction_ports.items()):
         if direction in ["E", "W"]:
-            # first sort along x then y
-            list_ports.sort(key=lambda p: p.x)
-            list_ports.sort(key=lambda p: p.y)
+            # sort along y, then x
+            list_ports.sort(key=lambda p: (p.y, p.x))
 
         if direction in ["S", "N"]:
-            # first sort along y then x
-            list_ports.sort(key=lambda p: p.y)
-            list_ports.sort(key=lambda p: p.x)
+            # sort along x, then y
+            list_ports.sort(key=lambda p: (p.x, p.y))
 
         for i, p in enumerate(list_ports):
             p.name = prefix + direction + str(i)
@@ -490,81 +461,59 @@ def _rename_ports_facing_side_ccw(
     """Renames ports counter-clockwise."""
     for direction, list_ports in list(direction_ports.items()):
         if direction in ["E", "W"]:
-            # first sort along x then y
-            list_ports.sort(key=lambda p: -p.x)
-            list_ports.sort(key=lambda p: -p.y)
+            # sort along -y, then -x
+            list_ports.sort(key=lambda p: (-p.y, -p.x))
 
         if direction in ["S", "N"]:
-            # first sort along y then x
-            list_ports.sort(key=lambda p: -p.y)
-            list_ports.sort(key=lambda p: -p.x)
+            # sort along -x, then -y
+            list_ports.sort(key=lambda p: (-p.x, -p.y))
 
         for i, p in enumerate(list_ports):
             p.name = prefix + direction + str(i)
 
 
-def _rename_ports_counter_clockwise(direction_ports, prefix="") -> None:
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: +p.y)  # sort south to north
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: -p.x)  # sort east to west
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: -p.y)  # sort north to south
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: +p.x)  # sort west to east
-
-    ports = east_ports + north_ports + west_ports + south_ports
-
-    for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
-
-
-def _rename_ports_clockwise(direction_ports: PortsMap, prefix: str = "") -> None:
-    """Rename ports in the clockwise direction starting from the bottom left \
-    (west) corner."""
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.y)  # sort north to south
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.x)  # sort west to east
-
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.y)  # sort south to north
-
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.x)  # sort east to west
-    # south_ports.sort(key=lambda p: p.y)  #  south first
-
-    ports = west_ports + north_ports + east_ports + south_ports
-
-    for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
-
-
-def _rename_ports_clockwise_top_right(
-    direction_ports: PortsMap, prefix: str = ""
+def _rename_ports_in_order(
+    direction_ports: PortsMap,
+    prefix: str = "",
+    key_signs: tuple[int, int, int, int] = (1, -1, -1, 1),
+    order: str = "ENWS",
 ) -> None:
-    """Rename ports in the clockwise direction starting from the top right \
-    corner."""
-    east_ports = direction_ports["E"]
-    east_ports.sort(key=lambda p: -p.y)  # sort north to south
-
-    north_ports = direction_ports["N"]
-    north_ports.sort(key=lambda p: +p.x)  # sort west to east
+    """Rename ports sorted along each side and numbered side by side.
 
-    west_ports = direction_ports["W"]
-    west_ports.sort(key=lambda p: +p.y)  # sort south to north
+    Args:
+        direction_ports: ports on each side (E, N, W, S).
+        prefix: to add on each port name. Ports are named by integers without it.
+        key_signs: sort direction along each side (E, N, W, S). E and W ports \
+                are sorted along y, N and S ports along x.
+        order: of the sides when numbering.
+    """
+    for direction, sign in zip("ENWS", key_signs):
+        if direction in "EW":
+            direction_ports[direction].sort(key=lambda p, sign=sign: sign * p.y)
+        else:
+            direction_ports[direction].sort(key=lambda p, sign=sign: sign * p.x)
 
-    south_ports = direction_ports["S"]
-    south_ports.sort(key=lambda p: -p.x)  # sort east to west
+    ports = itertools.chain.from_iterable(direction_ports[d] for d in order)
+    if prefix:
+        for i, p in enumerate(ports, start=1):
+            p.name = prefix + str(i)
+    else:
+        for i, p in enumerate(ports, start=1):
+            p.name = i
 
-    ports = east_ports + south_ports + west_ports + north_ports
 
-    for i, p in enumerate(ports):
-        p.name = f"{prefix}{i+1}" if prefix else i + 1
+# E south to north, N east to west, W north to south, S west to east
+_rename_ports_counter_clockwise = partial(
+    _rename_ports_in_order, key_signs=(1, -1, -1, 1), order="ENWS"
+)
+# start from the bottom left (west) corner
+_rename_ports_clockwise = partial(
+    _rename_ports_in_order, key_signs=(-1, 1, 1, -1), order="WNES"
+)
+# start from the top right corner
+_rename_ports_clockwise_top_right = partial(
+    _rename_ports_in_order, key_signs=(-1, 1, 1, -1), order="ESWN"
+)
 
 
 def rename_ports_by_orientation(
@@ -597,27 +546,21 @@ def rename_ports_by_orientation(
 
     """
     layers_excluded = layers_excluded or []
-    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
 
     ports = component.ports
     ports = select_ports(ports, **kwargs)
 
     ports_on_layer = [p for p in ports if p.layer not in layers_excluded]
+    if not ports_on_layer:
+        return component
 
+    direction_ports: PortsMap = {x: [] for x in ["E", "N", "W", "S"]}
     for p in ports_on_layer:
         # Make sure we can backtrack the parent component from the port
         p.parent = component
 
         if p.orientation is not None:
-            angle = p.orientation % 360
-            if angle <= 45 or angle >= 315:
-                direction_ports["E"].append(p)
-            elif angle <= 135 and angle >= 45:
-                direction_ports["N"].append(p)
-            elif angle <= 225 and angle >= 135:
-                direction_ports["W"].append(p)
-            else:
-                direction_ports["S"].append(p)
+            direction_ports[_port_direction(p.orientation)].append(p)
         else:
             direction_ports["S"].append(p)
 
@@ -733,15 +676,7 @@ def map_ports_layer_to_orientation(
         for p in ports_on_layer:
             p.name_original = p.name
             if p.orientation:
-                angle = p.orientation % 360
-                if angle <= 45 or angle >= 315:
-                    direction_ports["E"].append(p)
-                elif angle <= 135 and angle >= 45:
-                    direction_ports["N"].append(p)
-                elif angle <= 225 and angle >= 135:
-                    direction_ports["W"].append(p)
-                else:
-                    direction_ports["S"].append(p)
+                direction_ports[_port_direction(p.orientation)].append(p)
         function(direction_ports, prefix=f"{layer[0]}_{layer[1]}_")
         m |= {p.name: p.name_original for p in ports_on_layer}
     return m
@@ -776,15 +711,7 @@ def map_ports_to_orientation_cw(
 
     for p in ports_on_layer:
         p.name_original = p.name
-        angle = p.orientation % 360
-        if angle <= 45 or angle >= 315:
-            direction_ports["E"].append(p)
-        elif angle <= 135 and angle >= 45:
-            direction_ports["N"].append(p)
-        elif angle <= 225 and angle >= 135:
-            direction_ports["W"].append(p)
-        else:
-            direction_ports["S"].append(p)
+        direction_ports[_port_direction(p.orientation)].append(p)
     function(direction_ports)
     return {p.name: p.name_original for p in ports_on_layer}
 
@@ -823,15 +750,7 @@ def auto_rename_ports_layer_orientation(
 
         for p in ports_on_layer:
             p.name_original = p.name
-            angle = p.orientation % 360
-            if angle <= 45 or angle >= 315:
-                direction_ports["E"].append(p)
-            elif angle <= 135 and angle >= 45:
-                direction_ports["N"].append(p)
-            elif angle <= 225 and angle >= 135:
-                direction_ports["W"].append(p)
-            else:
-                direction_ports["S"].append(p)
+            direction_ports[_port_direction(p.orientation)].append(p)
 
         function(direction_ports, prefix=f"{layer[0]}_{layer[1]}_")
         new_ports |= {p.name: p for p in ports_on_layer}
@@ -30,6 +30,7 @@ from __future__ import annotations
 import warnings
 
 import kfactory as kf
+import numpy as np
 from kfactory.routing.electrical import route_elec
 from kfactory.routing.optical import OpticalManhattanRoute, place90, route
 
@@ -62,6 +63,8 @@ def route_single(
     waypoints: Coordinates | None = None,
     port_type: str = "optical",
     allow_width_mismatch: bool = False,
+    with_sbend: bool = False,
+    min_straight_length: float | None = None,
     **kwargs,
 ) -> OpticalManhattanRoute:
     """Returns a Manhattan Route between 2 ports.
@@ -82,6 +85,8 @@ def route_single(
         waypoints: list of points to pass through.
         port_type: port type to route.
         allow_width_mismatch: allow different port widths.
+        with_sbend: not implemented yet.
+        min_straight_length: not implemented yet.
         kwargs: cross_section settings.
 
 
@@ -100,18 +105,17 @@ def route_single(
     p1 = port1
     p2 = port2
 
-    with_sbend = kwargs.pop("with_sbend", None)
-    min_straight_length = kwargs.pop("min_straight_length", None)
-
     if with_sbend:
         warnings.warn("with_sbend is not implemented yet")
 
     if min_straight_length:
         warnings.warn("minimum straight length not implemented yet")
 
+    dbu = component.kcl.dbu
+    inv_dbu = 1 / dbu
     xs = gf.get_cross_section(cross_section, **kwargs)
     width = xs.width
-    width_dbu = width / component.kcl.dbu
+    width_dbu = width / dbu
     # straight = partial(straight, width=width, cross_section=cross_section)
     taper_cell = taper(cross_section=cross_section) if taper else None
     bend90 = (
@@ -125,22 +129,27 @@ def route_single(
     ) -> Component:
         return gf.get_component(
             straight,
-            length=length * component.kcl.dbu,
-            width=width * component.kcl.dbu,
+            length=length * dbu,
+            width=width * dbu,
             cross_section=cross_section,
             **kwargs,
         )
 
-    dbu = component.kcl.dbu
-    end_straight = round(end_straight_length / dbu)
-    start_straight = round(start_straight_length / dbu)
-
     if waypoints is not None:
         if not isinstance(waypoints[0], kf.kdb.Point):
-            w = [kf.kdb.Point(*p1.center)]
-            w += [kf.kdb.Point(p[0] / dbu, p[1] / dbu) for p in waypoints]
-            w += [kf.kdb.Point(*p2.center)]
-            waypoints = w
+            xy = np.asarray(waypoints, dtype=float) * inv_dbu
+            # round half away from zero, like DPoint.to_itype does
+            xy = np.sign(xy) * np.floor(np.abs(xy) + 0.5)
+            waypoints = [
+                p1.trans.disp.to_p(),
+                *(kf.kdb.Point(x, y) for x, y in xy.astype(np.int64).tolist()),
+                p2.trans.disp.to_p(),
+            ]
+
+        # repeated points would be zero length segments that place90 rejects
+        waypoints = [
+            pt for i, pt in enumerate(waypoints) if i == 0 or pt != waypoints[i - 1]
+        ]
 
         return place90(
             component,
@@ -154,19 +163,19 @@ def route_single(
             allow_width_mismatch=allow_width_mismatch,
         )
 
-    else:
-        return route(
-            component,
-            p1=p1,
-            p2=p2,
-            straight_factory=straight_dbu,
-            bend90_cell=bend90,
-            taper_cell=taper_cell,
-            start_straight=start_straight,
-            end_straight=end_straight,
-            port_type=port_type,
-            allow_width_mismatch=allow_width_mismatch,
-        )
+    # without waypoints, route plans the backbone from the start and end straights
+    return route(
+        component,
+        p1=p1,
+        p2=p2,
+        straight_factory=straight_dbu,
+        bend90_cell=bend90,
+        taper_cell=taper_cell,
+        start_straight=round(start_straight_length * inv_dbu),
+        end_straight=round(end_straight_length * inv_dbu),
+        port_type=port_type,
+        allow_width_mismatch=allow_width_mismatch,
+    )
 
 
 def route_single_electrical(
@@ -195,107 +204,25 @@ def route_single_electrical(
 
     """
     xs = gf.get_cross_section(cross_section)
-    layer = layer or xs.layer
-    width = width or xs.width
-    layer = gf.get_layer(layer)
+    layer = gf.get_layer(layer if layer is not None else xs.layer)
+    width = width if width is not None else xs.width
+    inv_dbu = 1 / component.kcl.dbu
     start_straight_length = (
-        start_straight_length / component.kcl.dbu if start_straight_length else None
-    )
-    end_straight_length = (
-        end_straight_length / component.kcl.dbu if end_straight_length else None
+        start_straight_length * inv_dbu if start_straight_length else None
     )
+    end_straight_length = end_straight_length * inv_dbu if end_straight_length else None
     route_elec(
         c=component,
         p1=port1,
         p2=port2,
         layer=layer,
-        width=round(width / component.kcl.dbu),
+        width=round(width * inv_dbu),
         start_straight=start_straight_length,
         end_straight=end_straight_length,
     )
 
 
 if __name__ == "__main__":
-    # c = gf.Component("demo")
-    # s = gf.c.wire_straight()
-    # pt = c << s
-    # pb = c << s
-    # pt.d.move((50, 50))
-    # gf.routing.route_single_electrical(
-    #     c,
-    #     pb.ports["e2"],
-    #     pt.ports["e1"],
-    #     cross_section="xs_sc",
-    #     start_straight_length=10,
-    #     end_straight_length=30,
-    # )
-    # c.show()
-
-    # c = gf.Component("waypoints_sample")
-    # w = gf.components.straight()
-    # left = c << w
-    # right = c << w
-    # right.d.move((100, 80))
-
-    # obstacle = gf.components.rectangle(size=(100, 10))
-    # obstacle1 = c << obstacle
-    # obstacle2 = c << obstacle
-    # obstacle1.d.ymin = 40
-    # obstacle2.d.xmin = 25
-
-    # p0 = left.ports["o2"]
-    # p1 = right.ports["o2"]
-    # p0x, p0y = left.ports["o2"].d.center
-    # p1x, p1y = right.ports["o2"].d.center
-    # o = 10  # vertical offset to overcome bottom obstacle
-    # ytop = 20
-
-    # r = gf.routing.route_single(
-    #     c,
-    #     p0,
-    #     p1,
-    #     cross_section="xs_rc",
-    #     waypoints=[
-    #         (p0x + o, p0y),
-    #         (p0x + o, ytop),
-    #         (p1x + o, ytop),
-    #         (p1x + o, p1y),
-    #     ],
-    # )
-    # c.show()
-
-    # c = gf.Component("electrical")
-    # w = gf.components.wire_straight()
-    # left = c << w
-    # right = c << w
-    # right.d.move((100, 80))
-
-    # obstacle = gf.components.rectangle(size=(100, 10))
-    # obstacle1 = c << obstacle
-    # obstacle2 = c << obstacle
-    # obstacle1.d.ymin = 40
-    # obstacle2.d.xmin = 25
-
-    # p0 = left.ports["e2"]
-    # p1 = right.ports["e2"]
-    # p0x, p0y = left.ports["e2"].d.center
-    # p1x, p1y = right.ports["e2"].d.center
-    # o = 10  # vertical offset to overcome bottom obstacle
-    # ytop = 20
-
-    # r = route_single_electrical(
-    #     c,
-    #     p0,
-    #     p1,
-    #     cross_section="xs_metal_routing",
-    #     waypoints=[
-    #         (p0x + o, p0y),
-    #         (p0x + o, ytop),
-    #         (p1x + o, ytop),
-    #         (p1x + o, p1y),
-    #     ],
-    # )
-    # c.show()
     c = gf.Component("waypoints_sample")
     w = gf.components.straight()
     top = c << w
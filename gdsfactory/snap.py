@@ -52,6 +52,8 @@ def snap_to_grid(
 ) -> Value:
     """snap x to grid_sizes
 
+    Snaps arrays element-wise in a single numpy pass.
+
     Args:
         x: value to snap.
         nm: Optional grid size in nm. If None, it will use the default grid size from PDK multiplied by grid_factor.
@@ -62,11 +64,15 @@ def snap_to_grid(
     grid_size = gf.kcl.dbu
 
     nm = nm or int(grid_size * 1000 * grid_factor)
+    if isinstance(x, int | float):
+        # round() and np.round both round half to even
+        return nm * round(x * 1e3 / nm) / 1e3
+
     y = nm * np.round(np.asarray(x, dtype=float) * 1e3 / nm) / 1e3
 
     if isinstance(x, tuple):
         return tuple(y)
-    elif isinstance(x, int | float | str | np.float_):
+    elif isinstance(x, str):
         return float(y)
     return y
 
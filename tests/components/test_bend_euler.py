@@ -0,0 +1,18 @@
+import gdsfactory as gf
+
+
+def test_bend_euler_s_ports() -> None:
+    c = gf.c.bend_euler_s()
+    b = gf.c.bend_euler()
+    assert c.ports["o2"].orientation == 0
+    assert c.ports["o2"].d.x == 2 * b.ports["o2"].d.x
+    assert c.ports["o2"].d.y == 2 * b.ports["o2"].d.y
+
+
+def test_bend_straight_bend_ports() -> None:
+    c = gf.c.bend_straight_bend(straight_length=10.0)
+    b = gf.c.bend_euler()
+    assert c.ports["o2"].orientation == 0
+    assert c.ports["o2"].d.x == 2 * b.ports["o2"].d.x
+    assert c.ports["o2"].d.y == 2 * b.ports["o2"].d.y + 10
+
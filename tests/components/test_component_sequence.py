@@ -0,0 +1,21 @@
+import gdsfactory as gf
+
+
+def test_component_sequence_symbols() -> None:
+    bend180 = gf.components.bend_circular180()
+    wg = gf.components.straight()
+    symbol_to_component = {
+        "A": (bend180, "o1", "o2"),
+        "B": (bend180, "o2", "o1"),
+        "-": (wg, "o1", "o2"),
+    }
+    c1 = gf.components.component_sequence(
+        sequence="AB-!A-B", symbol_to_component=symbol_to_component
+    )
+    c2 = gf.components.component_sequence(
+        sequence=("A", "B", "-", "!A", "-", "B"),
+        symbol_to_component=symbol_to_component,
+    )
+    assert [i.name for i in c1.insts] == [i.name for i in c2.insts]
+    assert c1.ports["o2"].d.center == c2.ports["o2"].d.center
+    assert c1.ports["o2"].orientation == c2.ports["o2"].orientation
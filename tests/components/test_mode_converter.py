@@ -0,0 +1,7 @@
+import gdsfactory as gf
+
+
+def test_mode_converter_ports() -> None:
+    c = gf.c.mode_converter()
+    assert c.ports["o2"].orientation == 180
+    assert c.ports["o4"].orientation == 0
@@ -0,0 +1,23 @@
+import gdsfactory as gf
+
+
+def test_pad_bbox_keeps_pad_port() -> None:
+    c = gf.components.pad(
+        size=(100.0, 100.0), bbox_layers=((2, 0), (3, 0)), bbox_offsets=(1.0, 2.0)
+    )
+    assert c.ports["pad"].d.width == 100
+    assert c.ports["pad"].layer == gf.get_layer("MTOP")
+    assert c.dbbox().width() == 104
+
+
+def test_pad_bbox_offsets_from_size() -> None:
+    c = gf.components.pad(
+        size=(100.0, 50.0),
+        bbox_layers=((2, 0), (3, 0), (4, 0)),
+        bbox_offsets=(1.0, 2.0, -5.0),
+    )
+    for layer, (w, h) in zip(
+        ((2, 0), (3, 0), (4, 0)), ((102, 52), (104, 54), (90, 40))
+    ):
+        box = c.dbbox(gf.get_layer(layer))
+        assert (box.width(), box.height()) == (w, h), layer
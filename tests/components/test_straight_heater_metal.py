@@ -0,0 +1,12 @@
+import gdsfactory as gf
+
+
+def test_straight_heater_metal_without_taper() -> None:
+    c = gf.components.straight_heater_metal(heater_taper_length=None)
+    c_taper = gf.components.straight_heater_metal(heater_taper_length=5.0)
+    assert c.ports["l_e1"].d.x - c_taper.ports["l_e1"].d.x == 5
+
+
+def test_straight_heater_metal_simple_without_taper() -> None:
+    c = gf.components.straight_heater_metal_simple(heater_taper_length=None)
+    assert "o1" in c.ports
@@ -0,0 +1,54 @@
+import numpy as np
+
+import gdsfactory as gf
+from gdsfactory.components.taper import _taper_points
+
+
+def test_taper_points() -> None:
+    points = _taper_points(
+        length=10.0,
+        widths=np.array([1.0, 2.0]),
+        offsets=np.array([0.0, 3.0]),
+        delta_width=1.0,
+    )
+    assert points.shape == (2, 4, 2)
+    np.testing.assert_allclose(points[0, :, 0], [0, 10, 10, 0])
+    np.testing.assert_allclose(points[0, :, 1], [0.5, 1.0, -1.0, -0.5])
+    np.testing.assert_allclose(points[1, :, 1], [-2.0, -1.5, -4.5, -4.0])
+
+
+def test_taper_points_out() -> None:
+    out = np.zeros((3, 4, 2))
+    points = _taper_points(
+        length=5.0,
+        widths=np.array([1.0, 2.0]),
+        offsets=np.array([0.0, 3.0]),
+        delta_width=-0.5,
+        out=out[1:],
+    )
+    assert np.shares_memory(points, out)
+    np.testing.assert_allclose(out[0], 0)
+    np.testing.assert_allclose(out[2, :, 1], [-2.0, -2.25, -3.75, -4.0])
+
+
+def test_taper_zero_length() -> None:
+    xs = gf.cross_section.strip(bbox_layers=[(111, 0)], bbox_offsets=[3.0])
+    c = gf.components.taper(length=0.0, cross_section=xs)
+    assert not c.get_polygons()
+    assert len(c.ports) == 2
+
+
+def test_taper_strip_to_ridge_bbox() -> None:
+    xs = gf.cross_section.strip(bbox_layers=[(111, 0)], bbox_offsets=[3.0])
+    c = gf.components.taper_strip_to_ridge(length=5.0, cross_section=xs)
+    (bbox,) = c.get_polygons()[(111, 0)]
+    assert bbox.bbox().height() * c.kcl.dbu == 12.0, "bbox must cover the slab"
+
+
+def test_taper_strip_to_ridge_bbox_every_call() -> None:
+    for length in (7.1, 8.1):
+        c = gf.components.taper_strip_to_ridge(
+            length=length, width2=0.9, w_slab2=3.0, cross_section="xs_rc_bbox"
+        )
+        bbox = c.dbbox(gf.get_layer((3, 0)))
+        assert bbox.height() == 9.0, length
@@ -44,6 +44,36 @@ def test_route_single_electrical_multilayer(
         data_regression.check(lengths)
 
 
+def test_route_single_waypoints_on_grid() -> None:
+    c = gf.Component()
+    s = gf.components.straight()
+    left = c << s
+    right = c << s
+    right.d.move((100.0, 80.0))
+    route = gf.routing.route_single(
+        c,
+        left.ports["o2"],
+        right.ports["o1"],
+        waypoints=[(32.001, 0.0), (32.001, 80.0)],
+    )
+    assert gf.kdb.Point(32001, 0) in route.backbone
+
+
+def test_route_single_waypoints_repeated() -> None:
+    c = gf.Component()
+    s = gf.components.straight()
+    left = c << s
+    right = c << s
+    right.d.move((100.0, 80.0))
+    route = gf.routing.route_single(
+        c,
+        left.ports["o2"],
+        right.ports["o1"],
+        waypoints=[(10.0, 0.0), (50.0, 0.0), (50.0, 0.0), (50.0, 80.0)],
+    )
+    assert len(route.backbone) == 4
+
+
 if __name__ == "__main__":
     # c = gf.Component("sample_connect")
     # mmi1 = c << gf.components.mmi1x2()
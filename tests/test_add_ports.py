@@ -22,10 +22,10 @@ def test_add_ports_list() -> None:
     assert len(c.ports) == 2, len(c.ports)
 
 
-def test_add_ports_from_pins(data_regression) -> None:
+def test_add_ports_from_pins(data_regression, tmp_path) -> None:
     c = gf.components.straight()
     add_pins(c)
-    gdspath = c.write_gds()
+    gdspath = c.write_gds(gdspath=tmp_path / f"{c.name}.gds")
     c2 = gf.import_gds(
         gdspath, post_process=add_ports_from_markers_inside, unique_names=False
     )
@@ -34,10 +34,10 @@ def test_add_ports_from_pins(data_regression) -> None:
         data_regression.check(d)
 
 
-def test_add_ports_from_pins_siepic(data_regression) -> None:
+def test_add_ports_from_pins_siepic(data_regression, tmp_path) -> None:
     c = gf.components.straight()
     add_pins_siepic(c)
-    gdspath = c.write_gds()
+    gdspath = c.write_gds(gdspath=tmp_path / f"{c.name}.gds")
     c2 = gf.import_gds(
         gdspath, post_process=add_ports_from_siepic_pins, unique_names=False
     )
@@ -47,7 +47,10 @@ def test_add_ports_from_pins_siepic(data_regression) -> None:
 
 
 if __name__ == "__main__":
-    test_add_ports_from_pins_siepic(None)
-    # test_add_ports_from_pins(None)
+    import pathlib
+    import tempfile
+
+    test_add_ports_from_pins_siepic(None, pathlib.Path(tempfile.mkdtemp()))
+    # test_add_ports_from_pins(None, pathlib.Path(tempfile.mkdtemp()))
     # test_add_ports_dict()
     # test_add_ports_list()
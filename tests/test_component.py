@@ -1,3 +1,5 @@
+import pytest
+
 import gdsfactory as gf
 
 
@@ -63,5 +65,54 @@ def test_remove_labels() -> None:
     assert len(c.labels) == 0
 
 
+def test_add_ports_from_arrays() -> None:
+    c = gf.Component()
+    ports = c.add_ports_from_arrays(
+        names=["e1", "e2"],
+        centers=[(0, 0), (10, 5)],
+        width=2,
+        orientation=90,
+        layer=(49, 0),
+        port_type="electrical",
+    )
+    assert len(ports) == 2
+    assert c.ports["e2"].d.center == (10, 5)
+    assert c.ports["e2"].d.width == 2
+    assert c.ports["e2"].orientation == 90
+    assert c.ports["e2"].port_type == "electrical"
+
+    c.add_ports_from_arrays(
+        names=["o1", "o2"],
+        centers=[(0, 0), (20, 0)],
+        width=[0.5, 1.0],
+        orientation=[180, 0],
+        layer=(1, 0),
+    )
+    assert c.ports["o1"].d.width == 0.5
+    assert c.ports["o1"].orientation == 180
+    assert c.ports["o2"].d.width == 1.0
+    assert c.ports["o2"].orientation == 0
+
+
+def test_add_polygon_kdb() -> None:
+    c = gf.Component()
+    c.add_polygon(gf.kdb.Polygon(gf.kdb.Box(1000, 2000)), layer=(1, 0))
+    c.add_polygon(gf.kdb.DPolygon(gf.kdb.DBox(1, 2)), layer=(2, 0))
+    assert c.area(layer=(1, 0)) == 2
+    assert c.area(layer=(2, 0)) == 2
+
+
+def test_add_shapes_from() -> None:
+    c = gf.Component()
+    c.add_shapes_from(gf.components.compass(size=(10, 10), layer=(1, 0)))
+    c.add_shapes_from(gf.components.compass(size=(5, 20), layer=(1, 0)))
+    assert not c.insts
+    c.flatten()
+    assert len(c.get_polygons()[(1, 0)]) == 1
+
+    with pytest.raises(ValueError):
+        c.add_shapes_from(gf.components.rectangle())
+
+
 if __name__ == "__main__":
     test_extract()
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import gdsfactory as gf
 
 
@@ -7,3 +9,38 @@ def test_get_cross_section() -> None:
     cross_section = {"cross_section": "xs_sc", "settings": {"width": 1}}
     xs = gf.get_cross_section(cross_section)
     assert xs.sections[0].width == 1
+
+
+def test_get_cross_section_cache(monkeypatch) -> None:
+    pdk = gf.get_active_pdk()
+    monkeypatch.setattr(pdk, "_cross_section_cache", OrderedDict())
+    xs = pdk.get_cross_section("xs_sc")
+    assert pdk.get_cross_section("xs_sc") is xs
+    assert pdk.get_cross_section("xs_sc", width=2).width == 2
+    xs2 = pdk.get_cross_section("xs_sc", width=2.0)
+    assert pdk.get_cross_section("xs_sc", width=2.0) is xs2
+    assert pdk.get_cross_section("xs_sc", width=2) is not xs2
+    assert pdk.get_cross_section("xs_sc", bbox_layers=[(1, 0)]).bbox_layers
+
+    monkeypatch.setitem(pdk.cross_sections, "xs_test_cache", gf.cross_section.strip)
+    assert pdk.get_cross_section("xs_test_cache").width == xs.width
+    monkeypatch.setitem(
+        pdk.cross_sections, "xs_test_cache", gf.partial(gf.cross_section.strip, width=3)
+    )
+    assert pdk.get_cross_section("xs_test_cache").width == 3
+
+
+def test_get_cross_section_cache_keeps_bbox() -> None:
+    for length in (5.0, 7.0):
+        c = gf.components.straight(length=length, cross_section="rib_bbox")
+        assert (3, 0) in c.get_polygons(), length
+
+
+def test_get_cross_section_cache_size(monkeypatch) -> None:
+    pdk = gf.get_active_pdk()
+    monkeypatch.setattr(pdk, "_cross_section_cache", OrderedDict())
+    for i in range(gf.pdk.cross_section_cache_size + 10):
+        pdk.get_cross_section("xs_sc", width=0.5 + i * 1e-3)
+    assert len(pdk._cross_section_cache) == gf.pdk.cross_section_cache_size
+    xs = pdk.get_cross_section("xs_sc")
+    assert pdk.get_cross_section("xs_sc") is xs
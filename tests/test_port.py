@@ -67,6 +67,12 @@ def test_get_ports_sort_counter_clockwise() -> None:
     assert p8.orientation == 270, p8.orientation
 
 
+def test_select_ports_names() -> None:
+    nxn = gf.components.nxn(west=2, north=2, east=2, south=2)
+    ports = gf.port.select_ports(nxn.ports, names=["o3", "o1", "o9"])
+    assert [p.name for p in ports] == ["o1", "o3"]
+
+
 @pytest.mark.parametrize("port_type", ["electrical", "optical", "placement"])
 def test_rename_ports(port_type, data_regression: DataRegressionFixture):
     c = gf.components.nxn(port_type=port_type)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 import gdsfactory as gf
 
 
@@ -12,6 +14,13 @@ def test_snap_to_2nm_grid() -> None:
     assert gf.snap.snap_to_grid2x(3.1e-3) == 0.004
 
 
+def test_snap_array_to_2nm_grid() -> None:
+    widths = np.array([1.1e-3, 3.1e-3, 0.5011])
+    snapped = gf.snap.snap_to_grid2x(widths)
+    np.testing.assert_allclose(snapped, [0.002, 0.004, 0.502])
+    assert [gf.snap.snap_to_grid2x(w) for w in widths] == snapped.tolist()
+
+
 def test_is_on_1x_grid() -> None:
     assert not gf.snap.is_on_grid(0.1e-3)
     assert gf.snap.is_on_grid(1e-3)